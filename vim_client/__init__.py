@@ -27,26 +27,46 @@
 import os
 import re
 import sys
-from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from shutil import which
 from subprocess import CalledProcessError, check_output  # nosec B404
-from typing import List, Union
+from typing import List, Pattern, Tuple, Union
 
 DEFAULT_VIM = ["vim", "gvim"]
 
+# Characters escaped by Vim's fnameescape() (see PATH_ESC_CHARS in Vim's
+# source code).
+VIM_PATH_ESC_CHARS = " \t\n*?[{`$\\%#'\"|!<"
+_VIM_PATH_ESC_TABLE = str.maketrans({char: f"\\{char}"
+                                    for char in VIM_PATH_ESC_CHARS})
+
 
 class VimClientError(Exception):
     """Exception raised by VimClient()."""
 
 
+@lru_cache(maxsize=None)
+def _resolve_vim_bin(list_vim_commands: Tuple[str, ...]) -> str:
+    """Return the path to the first Vim command found in $PATH (or '')."""
+    for bin_name in list_vim_commands:
+        bin_path = which(bin_name)
+        if bin_path:
+            return bin_path
+
+    return ""
+
+
 class VimClient:
     """Communicate with Vim via 'vim --remote*' command-line options."""
 
-    def __init__(self, server_name_regex: str, list_vim_bin: List[str]):
+    def __init__(self,
+                 server_name_regex: Union[str, Pattern[str]],
+                 list_vim_bin: List[str]):
         """Init VimClient.
 
-        :server_name_regex: Regex that is used to find the Vim server.
+        :server_name_regex: Regex that is used to find the Vim server (a
+        string is compiled with re.IGNORECASE).
         :list_vim_bin: List of paths to the Vim binary.
 
         """
@@ -56,9 +76,14 @@ class VimClient:
         self.vim_server_name = ""
         self._find_vim_server_name(server_name_regex)
 
-    def _fnameescape(self, string: str):
-        string = string.replace("'", "''")
-        return self.expr(f"fnameescape('{string}')")[0]
+    @staticmethod
+    def _fnameescape(string: str) -> str:
+        """Escape a file name the same way as Vim's fnameescape()."""
+        result = string.translate(_VIM_PATH_ESC_TABLE)
+        if result[:1] in (">", "+") or result == "-":
+            result = f"\\{result}"
+
+        return result
 
     def cmd_escape(self, cmd: str, arg: str):
         arg = self._fnameescape(arg)
@@ -67,27 +92,28 @@ class VimClient:
     def _find_vim_bin(self, list_vim_bin: List[str]):
         list_vim_commands = list_vim_bin if list_vim_bin else DEFAULT_VIM
 
-        for bin_name in list_vim_commands:
-            bin_path = which(bin_name)
-            if bin_path:
-                self.vim_bin = bin_path
-                return
+        self.vim_bin = _resolve_vim_bin(tuple(list_vim_commands))
+        if self.vim_bin:
+            return
 
         raise VimClientError(
             f"The Vim command was not found: {list_vim_commands}"
         )
 
-    def _find_vim_server_name(self, regex: str):
+    def _find_vim_server_name(self, regex: Union[str, Pattern[str]]):
+        if isinstance(regex, str):
+            regex = re.compile(regex, re.I)
+
         vim_server_list = self._vim_server_list()
         for server_name in vim_server_list:
-            if re.search(regex, server_name, re.I):
+            if regex.search(server_name):
                 self.vim_server_name = server_name
                 return
 
         if vim_server_list:
             raise VimClientError(
-                f"The regular expression '{regex}' does not match any of the "
-                f"running Vim servers: {vim_server_list}"
+                f"The regular expression '{regex.pattern}' does not match "
+                f"any of the running Vim servers: {vim_server_list}"
             )
         else:
             raise VimClientError(
@@ -96,18 +122,16 @@ class VimClient:
             )
 
     def _vim_server_list(self) -> List[str]:
-        result: List[str] = []
         try:
-            cmd_output = check_output([self.vim_bin, "--serverlist"])
+            cmd_output = check_output([self.vim_bin, "--serverlist"],
+                                      encoding="utf-8")
         except CalledProcessError:
-            return result
-
-        for line in cmd_output.decode().splitlines():
-            line = line.strip()
-            if line:
-                result.append(line)
+            return []
 
-        return result
+        return [server_name
+                for server_name in (line.strip()
+                                    for line in cmd_output.splitlines())
+                if server_name]
 
     def edit(self,
              files: Union[List[str], str, List[Path], Path],
@@ -137,12 +161,12 @@ class VimClient:
             return
 
         if isinstance(files, (Path, str)):
-            files = [Path(files)]
+            files = [os.fspath(files)]
         else:
-            files = [Path(item).absolute() for item in files]
+            files = [os.path.abspath(item) for item in files]
 
         if cwd:
-            cwd = Path(cwd).absolute()
+            cwd = os.path.abspath(cwd)
 
         if pre_commands is None:
             pre_commands = []
@@ -164,22 +188,26 @@ class VimClient:
                              "The valid values are: "
                              "'tab', 'split', 'vsplit', 'current_window'.")
 
-        commands = []
-        for filename in files:
-            commands += open_in_commands
-            if cwd:
-                commands += [self.cmd_escape("lcd", str(cwd))]
-
-            commands += pre_commands
+        lcd_commands = [self.cmd_escape("lcd", str(cwd))] if cwd else []
 
-            commands += [self.cmd_escape("edit", str(filename))]
-
-            commands += post_commands
+        commands: List[str] = []
+        for filename in files:
+            commands.extend(open_in_commands)
+            commands.extend(lcd_commands)
+            commands.extend(pre_commands)
+            commands.append(self.cmd_escape("edit", str(filename)))
+            commands.extend(post_commands)
 
         self.send_commands(commands)
 
     def ping(self):
-        """Check if Vim is listening to commands."""
+        """Check if Vim is listening to commands.
+
+        Calling this method is optional: it runs an additional 'vim
+        --remote-expr' process, and expr() and send_commands() already
+        raise VimClientError when the Vim server does not respond.
+
+        """
         if self.expr("1024")[0].strip() != "1024":
             raise VimClientError(f"The Vim server '{self.vim_server_name}' "
                                  "is not responding")
@@ -213,33 +241,22 @@ class VimClient:
         if isinstance(commands, str):
             commands = [commands]
 
-        vim_commands = ""
-        send = False
-        for command in commands:
-            if send:
-                vim_commands += " | "
-
-            vim_commands += command
-            send = True
-
-        if send:
-            self.expr(
-                f"""execute('{vim_commands.replace("'", "''")}')"""
-            )
+        vim_commands = " | ".join(commands)
+        self.expr(f"""execute('{vim_commands.replace("'", "''")}')""")
 
     def exec_vim(self, args: List[str]):
         """Execute Vim, replacing the current process."""
-        os.execl(self.vim_bin, *([self.vim_bin] + args))
+        os.execv(self.vim_bin, [self.vim_bin] + args)
         sys.exit(1)
 
     def run_vim_remote_get_output(self, args: List[str]) -> List[str]:
         """Execute 'vim --servername <server-name> <args>'."""
         vim_args = self._build_vim_remote_cmd_args(args=args)
-        return check_output([self.vim_bin] + vim_args) \
-            .decode().splitlines()
+        return check_output([self.vim_bin] + vim_args,
+                            encoding="utf-8").splitlines()
 
     def _build_vim_remote_cmd_args(self, args: List[str]) -> List[str]:
         vim_args: List[str] = []
         vim_args += ["--servername", self.vim_server_name]
-        vim_args += deepcopy(args)
+        vim_args += args
         return vim_args
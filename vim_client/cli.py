@@ -38,7 +38,10 @@ import sys
 from argparse import ArgumentParser, Namespace
 from typing import Tuple
 
-from . import DEFAULT_VIM, VimClient, VimClientError
+from . import DEFAULT_VIM, VimClient, VimClientError, _resolve_vim_bin
+
+# Vim commands executed before the files are opened by the CLI tools
+PRE_COMMANDS = ("call foreground()",)
 
 
 def cli_init(description: str,
@@ -129,8 +132,19 @@ def cli_init(description: str,
         cli_diff()
         sys.exit(0)
 
-    vim_server_name = ("^" + re.escape(args.servername) + "$"
-                       if args.servername else ".*")
+    if args.serverlist:
+        list_vim_cmd = args.vim_bin if args.vim_bin else DEFAULT_VIM
+        vim_bin_path = _resolve_vim_bin(tuple(list_vim_cmd))
+        if not vim_bin_path:
+            print(f"Error: Command not found: {list_vim_cmd}",
+                  file=sys.stderr)
+            sys.exit(1)
+
+        os.execv(vim_bin_path, [vim_bin_path, "--serverlist"])
+        sys.exit(1)
+
+    vim_server_name = re.compile("^" + re.escape(args.servername) + "$"
+                                 if args.servername else ".*", re.I)
     vim_client = None
     try:
         vim_client = VimClient(
@@ -169,7 +183,7 @@ def cli_init(description: str,
                          if args.servername else []) + args.paths)
             print(f"[RUN] {subprocess.list2cmdline(vim_args)}",
                   file=sys.stderr)
-            os.execl(vim_bin_path, *(vim_args))
+            os.execv(vim_bin_path, vim_args)
         except OSError as err:
             print(f"Error: Could not execute '{vim_cmd}': {err}",
                   file=sys.stderr)
@@ -177,10 +191,6 @@ def cli_init(description: str,
 
         sys.exit(1)
 
-    if args.serverlist:
-        vim_client.exec_vim(["--serverlist"])
-        sys.exit(0)
-
     if vim_type == "vimdiff" and len(args.paths) < 2:
         arg_parser.print_usage()
         sys.exit(1)
@@ -206,21 +216,22 @@ def cli_edit():
     )
 
     # Pre-commands
-    pre_commands = []
-    pre_commands += ["call foreground()"]
+    pre_commands = list(PRE_COMMANDS)
 
     # Post-commands
     post_commands = []
 
     # Paths
-    list_paths = [os.path.abspath(filename) for filename in args.paths]
+    cwd = os.getcwd()
+    list_paths = [os.path.normpath(os.path.join(cwd, filename))
+                  for filename in args.paths]
     if not list_paths:
         list_paths = ["."]
 
     # Edit the file/directory
     try:
         vim_client.edit(list_paths,
-                        cwd=os.getcwd(),
+                        cwd=cwd,
                         open_in=args.open_in,
                         pre_commands=pre_commands,
                         post_commands=post_commands)
@@ -248,27 +259,28 @@ def cli_diff():
               file=sys.stderr)
         sys.exit(1)
 
+    cwd = os.getcwd()
+    file1 = ""
+    diff_commands = []
     for filename in args.paths:
-        if not os.path.isfile(filename):
+        path = os.path.normpath(os.path.join(cwd, filename))
+        if not os.path.isfile(path):
             print(f"{cmdname}: {filename}: no such file or directory",
                   file=sys.stderr)
             sys.exit(1)
 
-    try:
-        pre_commands = []
-        diff_commands = []
-        file1 = os.path.abspath(args.paths[0])
-        for filename in args.paths[1:]:
-            filename = os.path.abspath(filename)
+        if not file1:
+            file1 = path
+        else:
             diff_commands.append(
-                vim_client.cmd_escape("silent diffsplit", filename),
+                vim_client.cmd_escape("silent diffsplit", path),
             )
 
-        pre_commands += ["call foreground()"]
+    try:
         vim_client.edit(file1,
-                        cwd=os.getcwd(),
+                        cwd=cwd,
                         open_in=args.open_in,
-                        pre_commands=pre_commands,
+                        pre_commands=list(PRE_COMMANDS),
                         post_commands=diff_commands)
     except VimClientError as err:
         print(f"{cmdname}: fatal: {err}.", file=sys.stderr)